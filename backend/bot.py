@@ -1,65 +1,182 @@
 """Pipecat bot for CAMB AI voice demo."""
 
+import asyncio
+import copy
 import os
+import sys
 import time
+from types import MappingProxyType
 from typing import Optional
 
+from dotenv import load_dotenv
 from loguru import logger
 
 from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.frames.frames import OutputTransportMessageFrame, TTSSpeakFrame
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from pipecat.frames.frames import (
+    OutputTransportMessageFrame,
+    StartFrame,
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
 from pipecat.processors.aggregators.llm_context import LLMContext
 from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
-from pipecat.services.camb.tts import CambTTSService
+from pipecat.services.camb.tts import MODEL_SAMPLE_RATES, CambTTSService
 from pipecat.services.deepgram.stt import DeepgramSTTService
 from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.transports.services.daily import DailyParams, DailyTransport
 
 from progress_tracker import STTProgressProcessor, LLMProgressProcessor, TTSStatusProcessor
 
-# Cached CAMB client
+load_dotenv()
+
+# API keys, resolved once so a missing key fails at startup
+CAMB_API_KEY = os.environ["CAMB_API_KEY"]
+DEEPGRAM_API_KEY = os.environ["DEEPGRAM_API_KEY"]
+OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
+
+# Cached API clients
 _camb_client = None
+_openai_client = None
 
 
 def get_camb_client():
     """Get or create the shared CAMB API client."""
     global _camb_client
     if _camb_client is None:
+        import httpx
         from camb.client import AsyncCambAI
         logger.info("Creating shared CAMB API client")
-        _camb_client = AsyncCambAI(api_key=os.getenv("CAMB_API_KEY"), timeout=60.0)
+        # HTTP/2 multiplexes concurrent sessions' TTS streams over pooled connections
+        _camb_client = AsyncCambAI(
+            api_key=CAMB_API_KEY,
+            httpx_client=httpx.AsyncClient(http2=True, timeout=60.0, follow_redirects=True),
+        )
     return _camb_client
 
 
+def get_openai_client():
+    """Get or create the shared OpenAI API client."""
+    global _openai_client
+    if _openai_client is None:
+        import httpx
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+        logger.info("Creating shared OpenAI API client")
+        # Same pool limits as Pipecat's own client; idle connections never expire,
+        # so the startup warmup is still open for the first session
+        _openai_client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=100, max_connections=1000, keepalive_expiry=None
+                )
+            ),
+        )
+    return _openai_client
+
+
+async def warm_clients():
+    """Create the shared API clients and open an OpenAI connection.
+
+    The CAMB client connects on first use; the startup greeting requests warm it.
+    """
+    get_camb_client()
+    client = get_openai_client()
+    try:
+        await client.models.list()
+        logger.info("OpenAI connection warmed")
+    except Exception as e:
+        logger.warning(f"OpenAI warmup failed: {e}")
+
+
+# VAD tuning shared by every session
+_VAD_PARAMS = VADParams(stop_secs=0.3)
+
+# Silero model whose ONNX inference session is shared by every analyzer
+_silero_model = None
+
+
+def get_silero_model():
+    """Get or load the shared Silero VAD model."""
+    global _silero_model
+    if _silero_model is None:
+        logger.info("Loading shared Silero VAD model")
+        _silero_model = SileroVADAnalyzer(params=_VAD_PARAMS)._model
+    return _silero_model
+
+
+class _SharedSileroVADAnalyzer(SileroVADAnalyzer):
+    """Silero VAD analyzer that reuses the shared ONNX inference session.
+
+    The inference session is stateless; the per-stream state lives on the model
+    wrapper, so each analyzer gets its own shallow copy with fresh state.
+    """
+
+    def __init__(self, *, params: VADParams):
+        VADAnalyzer.__init__(self, params=params)
+        self._model = copy.copy(get_silero_model())
+        self._model.reset_states()
+        self._last_reset_time = 0
+
+
+def create_vad_analyzer() -> SileroVADAnalyzer:
+    """Create a VAD analyzer backed by the shared Silero model."""
+    return _SharedSileroVADAnalyzer(params=_VAD_PARAMS)
+
+
+class _SharedCambTTSService(CambTTSService):
+    """CAMB TTS service that streams through the shared API client.
+
+    CambTTSService builds its own client in start(), so the shared one is swapped
+    in afterwards.
+    """
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        self._client = get_camb_client()
+
+
 def create_tts_service(model: str = "mars-flash", voice_id: str = "159131") -> CambTTSService:
     """Create a TTS service with shared API client."""
-    tts = CambTTSService(
-        api_key=os.getenv("CAMB_API_KEY"),
+    return _SharedCambTTSService(
+        api_key=CAMB_API_KEY,
         model=model,
         voice_id=voice_id
     )
-    tts._client = get_camb_client()
-    return tts
 
 
 def create_stt_service() -> DeepgramSTTService:
     """Create STT service."""
-    return DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
+    return DeepgramSTTService(api_key=DEEPGRAM_API_KEY)
+
+
+LLM_MODEL = "gpt-4o-mini"
+
+# OpenAI only caches prompt prefixes of at least this many tokens
+_PROMPT_CACHE_MIN_TOKENS = 1024
+
+
+class _SharedOpenAILLMService(OpenAILLMService):
+    """OpenAI LLM service that uses the shared API client instead of building one."""
+
+    def create_client(self, *args, **kwargs):
+        return get_openai_client()
 
 
 def create_llm_service() -> OpenAILLMService:
-    """Create LLM service."""
-    return OpenAILLMService(
-        api_key=os.getenv("OPENAI_API_KEY"),
-        model="gpt-4o-mini",
+    """Create LLM service with shared API client."""
+    return _SharedOpenAILLMService(
+        api_key=OPENAI_API_KEY,
+        model=LLM_MODEL,
     )
 
 
-CHARACTERS = {
+_CHARACTERS = {
     "bugs": {
         "name": "Bugs Bunny",
         "voice_id": "159131",
@@ -147,11 +264,85 @@ CRITICAL - Your responses will be read aloud by text-to-speech. You MUST:
     },
 }
 
+for _config in _CHARACTERS.values():
+    _config["system_prompt"] = sys.intern(_config["system_prompt"])
+    _config["greeting"] = sys.intern(_config["greeting"])
+
+# Read-only character registry shared by every session
+CHARACTERS = MappingProxyType(_CHARACTERS)
+_DEFAULT_CHARACTER = "bugs"
+
+# Frozen system-prompt prefix per character, built once so every session sends a
+# byte-identical prefix and hits the LLM provider's prompt cache.
+_PREFIX_MESSAGES = MappingProxyType({
+    key: [{"role": "system", "content": config["system_prompt"]}]
+    for key, config in CHARACTERS.items()
+})
+
+
+# System prompt token counts per character, filled by count_system_prompt_tokens()
+_SYS_TOKEN_COUNTS: dict[str, int] = {}
+
+
+def count_system_prompt_tokens():
+    """Count each system prompt's tokens so operators can size the prompt cache.
+
+    Loading the tokenizer may download its BPE file, so call this off the event loop.
+    """
+    try:
+        import tiktoken
+        encoding = tiktoken.encoding_for_model(LLM_MODEL)
+    except Exception as e:
+        logger.warning(f"Could not load tokenizer for {LLM_MODEL}: {e}")
+        return
+    for key, config in CHARACTERS.items():
+        count = len(encoding.encode(config["system_prompt"]))
+        _SYS_TOKEN_COUNTS[key] = count
+        cacheable = "cacheable" if count >= _PROMPT_CACHE_MIN_TOKENS else "below cache threshold"
+        logger.info(f"System prompt for {key}: {count} tokens ({cacheable})")
+
+
+# Pre-synthesized greeting PCM keyed by (character, tts_model)
+_GREETING_AUDIO: dict[tuple[str, str], bytes] = {}
+
+
+async def _synthesize_greeting(character: str, model: str):
+    """Fetch one character's greeting as raw PCM and store it in the cache."""
+    from camb.types import StreamTtsOutputConfiguration
+
+    config = CHARACTERS[character]
+    chunks = []
+    async for chunk in get_camb_client().text_to_speech.tts(
+        text=config["greeting"],
+        language="en-us",
+        voice_id=int(config["voice_id"]),
+        speech_model=model,
+        output_configuration=StreamTtsOutputConfiguration(format="pcm_s16le"),
+    ):
+        chunks.append(chunk)
+    audio = b"".join(chunks)
+    # Keep whole 16-bit samples only
+    _GREETING_AUDIO[(character, model)] = audio[: len(audio) // 2 * 2]
+
+
+async def synthesize_greetings(model: str = "mars-flash"):
+    """Pre-synthesize every character greeting so sessions start without a TTS round-trip."""
+    results = await asyncio.gather(
+        *(_synthesize_greeting(character, model) for character in CHARACTERS),
+        return_exceptions=True,
+    )
+    for character, result in zip(CHARACTERS, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to pre-synthesize greeting for {character}: {result}")
+    logger.info(f"Cached {len(_GREETING_AUDIO)} greeting(s) for TTS model {model}")
+
 
 async def run_bot(room_url: str, token: str, character: str = "bugs", tts_model: str = "mars-flash"):
     """Run the voice agent bot."""
     # Get character config (default to bugs if not found)
-    char_config = CHARACTERS.get(character, CHARACTERS["bugs"])
+    if character not in CHARACTERS:
+        character = _DEFAULT_CHARACTER
+    char_config = CHARACTERS[character]
 
     transport = DailyTransport(
         room_url,
@@ -161,7 +352,7 @@ async def run_bot(room_url: str, token: str, character: str = "bugs", tts_model:
             audio_in_enabled=True,
             audio_out_enabled=True,
             vad_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.3)),
+            vad_analyzer=create_vad_analyzer(),
         ),
     )
 
@@ -172,8 +363,8 @@ async def run_bot(room_url: str, token: str, character: str = "bugs", tts_model:
     logger.info(f"Using character: {character} ({char_config['name']})")
     logger.info(f"Using TTS model: {tts_model}, voice_id: {char_config['voice_id']}")
 
-    messages = [
-        {"role": "system", "content": char_config["system_prompt"]},
+    # Static prefix first, dynamic turns appended after it
+    messages = _PREFIX_MESSAGES[character] + [
         {"role": "assistant", "content": char_config["greeting"]},
     ]
 
@@ -184,6 +375,8 @@ async def run_bot(room_url: str, token: str, character: str = "bugs", tts_model:
     llm_progress = LLMProgressProcessor()
     tts_status = TTSStatusProcessor()
 
+    # Every processor drains its own input queue on its own task, so STT, LLM
+    # and TTS already overlap; no extra buffering stage is needed here.
     pipeline = Pipeline(
         [
             transport.input(),
@@ -208,15 +401,29 @@ async def run_bot(room_url: str, token: str, character: str = "bugs", tts_model:
     async def on_first_participant_joined(transport, participant):
         logger.info(f"Participant joined: {participant['id']}")
         greeting = char_config["greeting"]
+        greeting_audio = _GREETING_AUDIO.get((character, tts_model))
+        if greeting_audio:
+            # The output transport chunks the audio itself, so one frame is enough
+            speech = [
+                TTSStartedFrame(),
+                TTSAudioRawFrame(
+                    audio=greeting_audio,
+                    sample_rate=MODEL_SAMPLE_RATES.get(tts_model, 22050),
+                    num_channels=1,
+                ),
+                TTSStoppedFrame(),
+            ]
+        else:
+            speech = [TTSSpeakFrame(greeting)]
         await task.queue_frames([
             OutputTransportMessageFrame(message={
                 "type": "transcript",
                 "role": "assistant",
                 "text": greeting,
                 "final": True,
-                "timestamp": int(time.time() * 1000),
+                "timestamp": time.time_ns() // 1_000_000,
             }),
-            TTSSpeakFrame(greeting),
+            *speech,
         ])
 
     @transport.event_handler("on_participant_left")
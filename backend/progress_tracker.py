@@ -20,28 +20,75 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 
+# Minimum seconds between interim transcription status updates
+INTERIM_MIN_INTERVAL = 0.05
+
+# Constant status payloads, built once and shared by every session. Frames are
+# still created per push: each frame carries its own id and timing metadata, so
+# a single frame instance must not travel the pipeline more than once.
+_STATUS_LLM = {"type": "status", "status": "llm"}
+_STATUS_TTS = {"type": "status", "status": "tts"}
+_STATUS_IDLE = {"type": "status", "status": "idle"}
+
+
+def _lookup_handler(dispatch: dict, frame: Frame):
+    """Find the handler for a frame's exact type, resolving subclasses once per type."""
+    frame_type = type(frame)
+    if frame_type in dispatch:
+        return dispatch[frame_type]
+    handler = None
+    for cls, candidate in list(dispatch.items()):
+        if candidate is not None and issubclass(frame_type, cls):
+            handler = candidate
+            break
+    dispatch[frame_type] = handler
+    return handler
+
 
 class STTProgressProcessor(FrameProcessor):
     """Tracks STT progress."""
 
+    __slots__ = ("_user_message_id", "_last_interim", "_last_interim_ts", "_tmpl", "_dispatch")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._user_message_id: int = 0
+        self._last_interim: str = ""
+        self._last_interim_ts: float = 0.0
+        self._tmpl = {"type": "transcript", "role": "", "text": "", "final": True, "timestamp": 0}
+        self._dispatch = {
+            InterimTranscriptionFrame: self._on_interim_transcription,
+            TranscriptionFrame: self._on_transcription,
+        }
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, InterimTranscriptionFrame):
-            await self._send_status("listening", frame.text)
-
-        elif isinstance(frame, TranscriptionFrame):
-            self._user_message_id += 1
-            await self._send_status("stt", frame.text)
-            await self._send_transcript("user", frame.text, final=True, message_id=self._user_message_id)
-            await self._send_status("llm")
+        handler = _lookup_handler(self._dispatch, frame)
+        if handler is not None:
+            await handler(frame)
 
         await self.push_frame(frame, direction)
 
+    async def _on_interim_transcription(self, frame: InterimTranscriptionFrame):
+        # Skip repeated text and cap interim updates at 20 Hz
+        now = time.monotonic()
+        if frame.text == self._last_interim or now - self._last_interim_ts < INTERIM_MIN_INTERVAL:
+            return
+        self._last_interim = frame.text
+        self._last_interim_ts = now
+        await self._send_status("listening", frame.text)
+
+    async def _on_transcription(self, frame: TranscriptionFrame):
+        self._last_interim = ""
+        self._user_message_id += 1
+        await self._send_status("stt", frame.text)
+        await self._send_transcript("user", frame.text, final=True, message_id=self._user_message_id)
+        await self.push_frame(
+            OutputTransportMessageFrame(message=_STATUS_LLM),
+            FrameDirection.DOWNSTREAM,
+        )
+
     async def _send_status(self, status: str, text: Optional[str] = None):
         message = {"type": "status", "status": status}
         if text:
@@ -52,13 +99,12 @@ class STTProgressProcessor(FrameProcessor):
         )
 
     async def _send_transcript(self, role: str, text: str, final: bool = True, message_id: Optional[int] = None):
-        message = {
-            "type": "transcript",
-            "role": role,
-            "text": text,
-            "final": final,
-            "timestamp": int(time.time() * 1000),
-        }
+        tmpl = self._tmpl
+        tmpl["role"] = role
+        tmpl["text"] = text
+        tmpl["final"] = final
+        tmpl["timestamp"] = time.time_ns() // 1_000_000
+        message = tmpl.copy()
         if message_id is not None:
             message["messageId"] = message_id
         await self.push_frame(
@@ -70,51 +116,60 @@ class STTProgressProcessor(FrameProcessor):
 class LLMProgressProcessor(FrameProcessor):
     """Tracks LLM progress."""
 
+    __slots__ = ("_response_len", "_assistant_message_id", "_dispatch")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._assistant_text: str = ""
+        self._response_len: int = 0
         self._assistant_message_id: int = 0
+        self._dispatch = {
+            LLMFullResponseStartFrame: self._on_response_start,
+            LLMTextFrame: self._on_text,
+            LLMFullResponseEndFrame: self._on_response_end,
+        }
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, LLMFullResponseStartFrame):
-            self._assistant_text = ""
-            self._assistant_message_id += 1
-
-        elif isinstance(frame, LLMTextFrame):
-            self._assistant_text += frame.text
-            await self._send_transcript(
-                "assistant",
-                self._assistant_text,
-                final=False,
-                message_id=self._assistant_message_id
-            )
-
-        elif isinstance(frame, LLMFullResponseEndFrame):
-            if self._assistant_text:
-                await self._send_transcript(
-                    "assistant",
-                    self._assistant_text,
-                    final=True,
-                    message_id=self._assistant_message_id
-                )
-                self._assistant_text = ""
+        handler = _lookup_handler(self._dispatch, frame)
+        if handler is not None:
+            await handler(frame)
 
         await self.push_frame(frame, direction)
 
-    async def _send_transcript(self, role: str, text: str, final: bool = True, message_id: Optional[int] = None):
-        message = {
-            "type": "transcript",
-            "role": role,
-            "text": text,
-            "final": final,
-            "timestamp": int(time.time() * 1000),
-        }
-        if message_id is not None:
-            message["messageId"] = message_id
+    async def _on_response_start(self, frame: LLMFullResponseStartFrame):
+        self._response_len = 0
+        self._assistant_message_id += 1
+
+    async def _on_text(self, frame: LLMTextFrame):
+        self._response_len += len(frame.text)
+        await self._send_delta("assistant", frame.text, self._assistant_message_id)
+
+    async def _on_response_end(self, frame: LLMFullResponseEndFrame):
+        if self._response_len > 0:
+            # The frontend already holds the text; send only its length to reconcile
+            await self._send_transcript_end("assistant", self._assistant_message_id, self._response_len)
+            self._response_len = 0
+
+    async def _send_delta(self, role: str, delta: str, message_id: int):
         await self.push_frame(
-            OutputTransportMessageFrame(message=message),
+            OutputTransportMessageFrame(message={
+                "type": "transcript_delta",
+                "role": role,
+                "delta": delta,
+                "messageId": message_id,
+            }),
+            FrameDirection.DOWNSTREAM,
+        )
+
+    async def _send_transcript_end(self, role: str, message_id: int, length: int):
+        await self.push_frame(
+            OutputTransportMessageFrame(message={
+                "type": "transcript_end",
+                "role": role,
+                "messageId": message_id,
+                "length": length,
+            }),
             FrameDirection.DOWNSTREAM,
         )
 
@@ -122,43 +177,39 @@ class LLMProgressProcessor(FrameProcessor):
 class TTSStatusProcessor(FrameProcessor):
     """Processor to track TTS status and interruptions."""
 
+    __slots__ = ("_is_speaking", "_dispatch")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._is_speaking = False
+        self._dispatch = {
+            StartInterruptionFrame: self._on_tts_stopped,
+            TTSStartedFrame: self._on_tts_started,
+            TTSStoppedFrame: self._on_tts_stopped,
+            TTSSpeakFrame: self._on_tts_started,
+        }
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, StartInterruptionFrame):
-            if self._is_speaking:
-                self._is_speaking = False
-                await self.push_frame(
-                    OutputTransportMessageFrame(message={"type": "status", "status": "idle"}),
-                    FrameDirection.DOWNSTREAM,
-                )
-
-        elif isinstance(frame, TTSStartedFrame):
-            if not self._is_speaking:
-                self._is_speaking = True
-                await self.push_frame(
-                    OutputTransportMessageFrame(message={"type": "status", "status": "tts"}),
-                    FrameDirection.DOWNSTREAM,
-                )
-
-        elif isinstance(frame, TTSStoppedFrame):
-            if self._is_speaking:
-                self._is_speaking = False
-                await self.push_frame(
-                    OutputTransportMessageFrame(message={"type": "status", "status": "idle"}),
-                    FrameDirection.DOWNSTREAM,
-                )
-
-        elif isinstance(frame, TTSSpeakFrame):
-            if not self._is_speaking:
-                self._is_speaking = True
-                await self.push_frame(
-                    OutputTransportMessageFrame(message={"type": "status", "status": "tts"}),
-                    FrameDirection.DOWNSTREAM,
-                )
+        handler = _lookup_handler(self._dispatch, frame)
+        if handler is not None:
+            await handler(frame)
 
         await self.push_frame(frame, direction)
+
+    async def _on_tts_started(self, frame: Frame):
+        if not self._is_speaking:
+            self._is_speaking = True
+            await self.push_frame(
+                OutputTransportMessageFrame(message=_STATUS_TTS),
+                FrameDirection.DOWNSTREAM,
+            )
+
+    async def _on_tts_stopped(self, frame: Frame):
+        if self._is_speaking:
+            self._is_speaking = False
+            await self.push_frame(
+                OutputTransportMessageFrame(message=_STATUS_IDLE),
+                FrameDirection.DOWNSTREAM,
+            )
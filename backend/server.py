@@ -1,14 +1,17 @@
 """FastAPI server for CAMB AI voice demo."""
 
+import asyncio
 import os
+import threading
 import time
+from pathlib import Path
 from typing import Optional
 from contextlib import asynccontextmanager
 
 import aiohttp
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
@@ -17,7 +20,7 @@ from pydantic import BaseModel
 
 from pipecat.transports.services.helpers.daily_rest import DailyRESTHelper, DailyRoomParams
 
-from bot import run_bot, CHARACTERS
+from bot import run_bot, count_system_prompt_tokens, get_silero_model, synthesize_greetings, warm_clients, CHARACTERS
 
 
 class ConnectRequest(BaseModel):
@@ -25,25 +28,50 @@ class ConnectRequest(BaseModel):
 
 load_dotenv()
 
+DAILY_API_KEY = os.getenv("DAILY_API_KEY")
+PORT = int(os.getenv("PORT", 7860))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+
+# Room properties shared by every temporary room; "exp" is set per request
+_ROOM_PROPS_BASE = {
+    "enable_chat": False,
+    "enable_emoji_reactions": False,
+    "eject_at_room_exp": True,
+}
+
 _aiohttp_session: Optional[aiohttp.ClientSession] = None
 _daily_helper: Optional[DailyRESTHelper] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage aiohttp session lifecycle."""
+    """Manage aiohttp session lifecycle and warm shared bot resources."""
     global _aiohttp_session, _daily_helper
     _aiohttp_session = aiohttp.ClientSession()
-    daily_api_key = os.getenv("DAILY_API_KEY")
-    if daily_api_key:
+    if DAILY_API_KEY:
         _daily_helper = DailyRESTHelper(
-            daily_api_key=daily_api_key,
+            daily_api_key=DAILY_API_KEY,
             aiohttp_session=_aiohttp_session,
         )
         logger.info("Daily REST helper initialized")
     else:
         logger.warning("DAILY_API_KEY not set - voice calls will not work")
+    # Warmups are independent, so run them concurrently; a failure only costs warmth
+    results = await asyncio.gather(
+        asyncio.to_thread(get_silero_model),
+        warm_clients(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Startup warmup failed: {result}")
+    # Sessions fall back to live TTS until greetings are cached
+    greetings_task = asyncio.create_task(synthesize_greetings())
+    # Token counts are informational; a daemon thread means a stalled tokenizer
+    # download can hold up neither startup nor shutdown
+    threading.Thread(target=count_system_prompt_tokens, daemon=True).start()
     yield
+    greetings_task.cancel()
     await _aiohttp_session.close()
 
 
@@ -83,20 +111,15 @@ async def connect(request: ConnectRequest, background_tasks: BackgroundTasks):
     try:
         # Create a temporary Daily room (expires in 10 minutes)
         room = await _daily_helper.create_room(
-            DailyRoomParams(
-                properties={
-                    "exp": time.time() + 600,
-                    "enable_chat": False,
-                    "enable_emoji_reactions": False,
-                    "eject_at_room_exp": True,
-                },
-            )
+            DailyRoomParams(properties={**_ROOM_PROPS_BASE, "exp": time.time() + 600})
         )
         logger.info(f"Created Daily room: {room.url}")
 
-        # Generate tokens
-        user_token = await _daily_helper.get_token(room_url=room.url, expiry_time=600)
-        bot_token = await _daily_helper.get_token(room_url=room.url, expiry_time=600)
+        # Generate tokens concurrently
+        user_token, bot_token = await asyncio.gather(
+            _daily_helper.get_token(room_url=room.url, expiry_time=600),
+            _daily_helper.get_token(room_url=room.url, expiry_time=600),
+        )
 
         # Start the bot in the background with selected character
         background_tasks.add_task(run_bot, room.url, bot_token, request.character)
@@ -113,24 +136,43 @@ async def connect(request: ConnectRequest, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=f"Failed to connect: {str(e)}")
 
 
+@app.middleware("http")
+async def static_cache_headers(request: Request, call_next):
+    """Let browsers keep hashed build assets and revalidate everything else."""
+    response = await call_next(request)
+    if request.url.path.startswith("/assets/"):
+        # Never pin errors, e.g. a hashed asset missing mid-deploy
+        if response.status_code == 200:
+            response.headers.setdefault("Cache-Control", "public, max-age=31536000, immutable")
+    elif not request.url.path.startswith("/api/"):
+        response.headers.setdefault("Cache-Control", "no-cache")
+    return response
+
+
 # Mount static files for frontend (check multiple possible locations)
-frontend_path = os.path.realpath(os.path.join(os.path.dirname(__file__), "frontend", "dist"))
-if not os.path.exists(frontend_path):
-    frontend_path = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "frontend", "dist"))
+frontend_path = (Path(__file__).parent / "frontend" / "dist").resolve()
+if not frontend_path.is_dir():
+    frontend_path = (Path(__file__).parent.parent / "frontend" / "dist").resolve()
 logger.info(f"Looking for frontend at: {frontend_path}")
-if os.path.exists(frontend_path):
+if frontend_path.is_dir():
     logger.info("Frontend found, mounting static files")
-    app.mount("/", StaticFiles(directory=frontend_path, html=True), name="static")
+    app.mount("/", StaticFiles(directory=str(frontend_path), html=True, check_dir=False), name="static")
 else:
     logger.warning(f"Frontend not found at {frontend_path}")
 
 
 def main():
     """Entry point for the server."""
-    port = int(os.getenv("PORT", 7860))
-    print(f"Starting CAMB AI Voice Demo on port {port}...")
-    print(f"API docs available at http://localhost:{port}/docs")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    print(f"Starting CAMB AI Voice Demo on port {PORT}...")
+    print(f"API docs available at http://localhost:{PORT}/docs")
+    # uvicorn picks uvloop and httptools automatically when they are installed.
+    # Multiple workers need an import string so each process loads its own app.
+    uvicorn.run(
+        "server:app" if WEB_CONCURRENCY > 1 else app,
+        host="0.0.0.0",
+        port=PORT,
+        workers=WEB_CONCURRENCY,
+    )
 
 
 if __name__ == "__main__":
@@ -24,6 +24,7 @@ function App() {
   const [transcript, setTranscript] = useState<string>('')
   const [selectedCharacter, setSelectedCharacter] = useState<string>('bugs')
   const callRef = useRef<DailyCall | null>(null)
+  const streamingRef = useRef<{ messageId?: number; text: string }>({ text: '' })
 
   const connect = useCallback(async () => {
     // Prevent double-clicks
@@ -64,6 +65,7 @@ function App() {
         setConnectionState('idle')
         setAgentState('idle')
         setTranscript('')
+        streamingRef.current = { text: '' }
       })
 
       callObject.on('error', (error) => {
@@ -84,7 +86,15 @@ function App() {
       // Handle app messages from the bot
       callObject.on('app-message', (event) => {
         if (event.data) {
-          const data = event.data as { type: string; status?: string; text?: string; role?: string }
+          const data = event.data as {
+            type: string
+            status?: string
+            text?: string
+            role?: string
+            delta?: string
+            messageId?: number
+            length?: number
+          }
           console.log('[Daily] App message:', data)
 
           if (data.type === 'status') {
@@ -107,6 +117,25 @@ function App() {
           if (data.type === 'transcript' && data.text) {
             setTranscript(data.text)
           }
+
+          // Streaming assistant text arrives as deltas, rebuild it per message
+          if (data.type === 'transcript_delta' && data.delta) {
+            const streaming = streamingRef.current
+            if (streaming.messageId !== data.messageId) {
+              streaming.messageId = data.messageId
+              streaming.text = ''
+            }
+            streaming.text += data.delta
+            setTranscript(streaming.text)
+          }
+
+          // Length is counted in code points on the backend
+          if (data.type === 'transcript_end' && data.messageId === streamingRef.current.messageId) {
+            const received = Array.from(streamingRef.current.text).length
+            if (received !== data.length) {
+              console.warn(`[Daily] Transcript ${data.messageId} incomplete: ${received}/${data.length} chars`)
+            }
+          }
         }
       })
 
@@ -128,6 +157,7 @@ function App() {
     setConnectionState('idle')
     setAgentState('idle')
     setTranscript('')
+    streamingRef.current = { text: '' }
   }, [])
 
   const toggleMute = useCallback(() => {